@@ -0,0 +1,14 @@
+"""
+Shared Constants Module
+Weekly grid labels used by the scheduler, reports and the GUI
+"""
+import sys
+
+# Interned once so every module compares and hashes the very same strings
+DAYS = tuple(sys.intern(day) for day in (
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday"
+))
+TIME_SLOTS = tuple(sys.intern(time_slot) for time_slot in (
+    "08:30 - 09:20", "09:30 - 10:20", "10:30 - 11:20", "11:30 - 12:20",
+    "13:20 - 14:10", "14:20 - 15:10", "15:20 - 16:10", "16:20 - 17:10"
+))
@@ -4,9 +4,45 @@ Handles import/export from JSON and CSV
 """
 import json
 import csv
-from typing import List, Dict
+import mmap
+from typing import List, Dict, Tuple
 from models import Course, Room, Instructor
 
+# Read buffer size for text loads, large enough that big files need only a few read() calls
+_TEXT_READ_BUFFER = 1 << 20
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None  # type: ignore
+
+try:
+    import cysimdjson  # type: ignore
+    _PARSER = cysimdjson.JSONParser()
+except ImportError:  # cysimdjson is optional, parse_json_lazy falls back to load_from_json
+    _PARSER = None
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.compute as pa_compute  # type: ignore
+    import pyarrow.csv as pa_csv  # type: ignore
+except ImportError:  # pyarrow is optional, CSV falls back to the csv module
+    pa = None
+    pa_compute = None
+    pa_csv = None
+
+# pyarrow writes CSV bytes identical to csv.writer only without quoting and with
+# \r\n line ends (needs pyarrow 26). Values that need quotes raise ArrowInvalid
+# and are left to the csv module.
+_ARROW_CSV_WRITE_OPTIONS = None
+if pa_csv is not None:
+    try:
+        _ARROW_CSV_WRITE_OPTIONS = pa_csv.WriteOptions(
+            quoting_style="none", quoting_header="none", eol="\r\n"
+        )
+    except TypeError:  # older pyarrow, CSV writing stays with the csv module
+        pass
+
 
 class DataManager:
     """Manages data import/export operations"""
@@ -14,37 +50,136 @@ class DataManager:
     @staticmethod
     def load_from_json(filepath: str) -> Dict:
         """Load data from JSON file"""
-        with open(filepath, 'r', encoding='utf-8') as f:
+        if orjson is not None:
+            # Unbuffered: the file is mmapped, a read buffer would go unused
+            with open(filepath, 'rb', buffering=0) as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:  # empty files cannot be mapped
+                    return orjson.loads(f.read())
+                # Parse straight from the page cache, no intermediate bytes copy
+                with mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+        with open(filepath, 'r', encoding='utf-8', buffering=_TEXT_READ_BUFFER) as f:
             return json.load(f)
     
     @staticmethod
-    def save_to_json(data: Dict, filepath: str):
-        """Save data to JSON file"""
+    def save_to_json(data: Dict, filepath: str, pretty: bool = False):
+        """
+        Save data to JSON file
+        Compact by default, pretty=True indents for human readers
+        """
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=option))
+            return
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            if pretty:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+            f.write('\n')
+    
+    @staticmethod
+    def parse_json_lazy(filepath: str):
+        """
+        Parse JSON file into a read-only, dict-like document.
+        Values are only converted to Python objects when they are accessed,
+        so the result must be consumed before the next lazy parse.
+        """
+        if _PARSER is None:
+            return DataManager.load_from_json(filepath)
+        return _PARSER.load(filepath)
     
     @staticmethod
     def load_from_csv(filepath: str) -> List[Dict]:
         """Load data from CSV file"""
+        if pa_csv is not None:
+            try:
+                return DataManager.load_from_csv_arrow(filepath).to_pylist()
+            except pa.ArrowInvalid:  # rows with too few or too many fields, ...
+                pass
         data = []
-        with open(filepath, 'r', encoding='utf-8') as f:
+        with open(filepath, 'r', encoding='utf-8', buffering=_TEXT_READ_BUFFER) as f:
             reader = csv.DictReader(f)
             for row in reader:
                 data.append(row)
         return data
     
+    @staticmethod
+    def load_from_csv_arrow(filepath: str):
+        """
+        Load CSV file into a pyarrow Table for column-wise processing.
+        All columns are read as strings, same as csv.DictReader.
+        Raises pyarrow.ArrowInvalid for rows with a different number of fields.
+        """
+        if pa_csv is None:
+            raise ImportError("pyarrow is required for load_from_csv_arrow")
+        # Column names come from the csv module, so they match csv.DictReader
+        # (a UTF-8 BOM stays in the first name, pyarrow would strip it)
+        with open(filepath, 'r', encoding='utf-8') as f:
+            header = next(csv.reader(f), [])
+        if not header:  # empty file, no columns and no rows (pyarrow rejects it)
+            return pa.table({})
+        # The header is read as the first data row under generated names f0, f1, ...
+        # which every column type is keyed by, then dropped
+        read_options = pa_csv.ReadOptions(autogenerate_column_names=True)
+        convert_options = pa_csv.ConvertOptions(
+            column_types={f"f{i}": pa.string() for i in range(len(header))}
+        )
+        table = pa_csv.read_csv(filepath, read_options=read_options,
+                                convert_options=convert_options)
+        columns = []
+        for column in table.slice(1).columns:
+            # Line ends inside quoted values read as \n, like a text-mode file
+            if pa_compute.any(pa_compute.match_substring(column, "\r")).as_py():
+                column = pa_compute.replace_substring_regex(column, "\r\n?", "\n")
+            columns.append(column)
+        return pa.Table.from_arrays(columns, names=header)
+    
     @staticmethod
     def save_to_csv(data: List[Dict], filepath: str, fieldnames: List[str]):
         """Save data to CSV file"""
+        # Same check as csv.DictWriter: every key must be a known field
+        known = set(fieldnames)
+        for row in data:
+            wrong_fields = [key for key in row if key not in known]
+            if wrong_fields:
+                raise ValueError("dict contains fields not in fieldnames: "
+                                 + ", ".join(repr(key) for key in wrong_fields))
+        # Missing keys are written empty, like DictWriter's default restval
+        columns = {name: [row.get(name) for row in data] for name in fieldnames}
+        DataManager.save_columns_to_csv(columns, filepath)
+    
+    @staticmethod
+    def save_columns_to_csv(columns: Dict[str, List], filepath: str):
+        """Save column name -> values mapping to CSV file (all columns same length)"""
+        # A single column is left to the csv module, which quotes empty values there
+        if _ARROW_CSV_WRITE_OPTIONS is not None and len(columns) > 1:
+            try:
+                # Values are written as text, formatted with str() like the csv module
+                # does, so mixed-type columns work and True stays "True"
+                table = pa.Table.from_arrays(
+                    [pa.array([None if value is None else str(value) for value in values], type=pa.string())
+                     for values in columns.values()],
+                    names=list(columns)
+                )
+                pa_csv.write_csv(table, filepath, write_options=_ARROW_CSV_WRITE_OPTIONS)
+                return
+            except pa.ArrowInvalid:  # values needing quotes, columns of different length, ...
+                pass
         with open(filepath, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(zip(*columns.values()))
     
     @staticmethod
     def parse_courses(data: Dict) -> List[Course]:
         """Parse courses from data dictionary"""
-        courses = []
+        courses: List[Course] = []
         for course_data in data.get('courses', []):
             course = Course(
                 code=course_data['code'],
@@ -61,7 +196,7 @@ class DataManager:
     @staticmethod
     def parse_rooms(data: Dict) -> List[Room]:
         """Parse rooms from data dictionary"""
-        rooms = []
+        rooms: List[Room] = []
         for room_data in data.get('rooms', []):
             room = Room(
                 id=room_data['id'],
@@ -71,10 +206,34 @@ class DataManager:
             rooms.append(room)
         return rooms
     
+    @staticmethod
+    def parse_courses_indexed(data: Dict) -> Tuple[List[Course], Dict[str, Course]]:
+        """
+        Parse courses and index them in the same pass
+        Returns (all courses, first session by code)
+        """
+        courses = DataManager.parse_courses(data)
+        by_code: Dict[str, Course] = {}
+        for course in courses:
+            by_code.setdefault(course.code, course)
+        return courses, by_code
+    
+    @staticmethod
+    def parse_rooms_indexed(data: Dict) -> Tuple[List[Room], Dict[str, Room]]:
+        """
+        Parse rooms and index them in the same pass
+        Returns (all rooms, first room by id)
+        """
+        rooms = DataManager.parse_rooms(data)
+        by_id: Dict[str, Room] = {}
+        for room in rooms:
+            by_id.setdefault(room.id, room)
+        return rooms, by_id
+    
     @staticmethod
     def parse_instructors(data: Dict) -> List[Instructor]:
         """Parse instructors from data dictionary"""
-        instructors = []
+        instructors: List[Instructor] = []
         for inst_data in data.get('instructors', []):
             instructor = Instructor(
                 id=inst_data['id'],
@@ -85,61 +244,106 @@ class DataManager:
         return instructors
     
     @staticmethod
-    def export_schedule_to_json(scheduler, filepath: str):
-        """Export schedule to JSON file"""
-        schedule_data = {
-            "days": scheduler.days,
-            "time_slots": scheduler.time_slots,
-            "schedule": {}
+    def _instructor_names(scheduler) -> Dict[int, str]:
+        """Build instructor id -> display name lookup once per export"""
+        return {
+            inst_id: inst.name if inst else f"Instructor {inst_id}"
+            for inst_id, inst in scheduler.instructors.items()
         }
+    
+    @staticmethod
+    def export_schedule_to_json(scheduler, filepath: str, pretty: bool = False):
+        """
+        Export schedule to JSON file
+        Only occupied slots are written, a missing day/time means an empty cell
+        """
+        days = scheduler.days
+        time_slots = scheduler.time_slots
+        inst_name = DataManager._instructor_names(scheduler)
         
-        for day in scheduler.days:
-            schedule_data["schedule"][day] = {}
-            for time_slot in scheduler.time_slots:
-                slot = scheduler.schedule[day][time_slot]
-                if slot.course:
-                    schedule_data["schedule"][day][time_slot] = {
-                        "course_code": slot.course.code,
-                        "course_name": slot.course.name,
-                        "instructor_id": slot.course.instructor_id,
-                        "instructor_name": scheduler.instructors.get(slot.course.instructor_id).name if scheduler.instructors.get(slot.course.instructor_id) else f"Instructor {slot.course.instructor_id}",
-                        "room_id": slot.room.id if slot.room else None,
-                        "room_capacity": slot.room.capacity if slot.room else None,
-                        "is_lab": slot.course.is_lab,
-                        "year": slot.course.year,
-                        "has_conflict": slot.has_conflict
-                    }
-                else:
-                    schedule_data["schedule"][day][time_slot] = None
+        records: List[Dict] = []
+        for slot in scheduler.slots:
+            course = slot.course
+            if course:
+                room = slot.room
+                records.append({
+                    "day": slot.day,
+                    "time_slot": slot.time_slot,
+                    "course_code": course.code,
+                    "course_name": course.name,
+                    "instructor_id": course.instructor_id,
+                    "instructor_name": inst_name.get(course.instructor_id, f"Instructor {course.instructor_id}"),
+                    "room_id": room.id if room else None,
+                    "room_capacity": room.capacity if room else None,
+                    "is_lab": course.is_lab,
+                    "year": course.year,
+                    "has_conflict": slot.has_conflict
+                })
         
-        DataManager.save_to_json(schedule_data, filepath)
+        schedule_data = {
+            "days": days,
+            "time_slots": time_slots,
+            "slots": records
+        }
+        DataManager.save_to_json(schedule_data, filepath, pretty)
+    
+    @staticmethod
+    def iter_schedule_slots(schedule_data):
+        """
+        Yield (day, time_slot, slot_data) for each occupied slot of an exported schedule
+        Supports the flat "slots" list and the older nested "schedule" layout,
+        where empty cells were written as null
+        """
+        if 'slots' in schedule_data:
+            for slot_data in schedule_data['slots']:
+                if slot_data is None:
+                    continue
+                yield slot_data.get('day'), slot_data.get('time_slot'), slot_data
+        else:
+            for day, day_data in schedule_data['schedule'].items():
+                if day_data is None:
+                    continue
+                for time_slot, slot_data in day_data.items():
+                    if slot_data is None:
+                        continue
+                    yield day, time_slot, slot_data
     
     @staticmethod
     def export_schedule_to_csv(scheduler, filepath: str):
         """Export schedule to CSV file"""
-        rows = []
-        for day in scheduler.days:
-            for time_slot in scheduler.time_slots:
-                slot = scheduler.schedule[day][time_slot]
-                if slot.course:
-                    instructor = scheduler.instructors.get(slot.course.instructor_id)
-                    instructor_name = instructor.name if instructor else f"Instructor {slot.course.instructor_id}"
-                    
-                    rows.append({
-                        "Day": day,
-                        "Time": time_slot,
-                        "Course Code": slot.course.code,
-                        "Course Name": slot.course.name,
-                        "Instructor": instructor_name,
-                        "Room": slot.room.id if slot.room else "N/A",
-                        "Room Type": "Lab" if slot.room.is_lab else "Classroom" if slot.room else "N/A",
-                        "Year": slot.course.year,
-                        "Type": "Lab" if slot.course.is_lab else "Theory",
-                        "Conflict": "Yes" if slot.has_conflict else "No"
-                    })
+        inst_name = DataManager._instructor_names(scheduler)
+        
+        # One list per CSV column, filled in a single pass over the slots
+        days, times, codes, names, instructors = [], [], [], [], []
+        rooms, room_types, years, types, conflicts = [], [], [], [], []
+        for slot in scheduler.slots:
+            course = slot.course
+            if course:
+                room = slot.room
+                days.append(slot.day)
+                times.append(slot.time_slot)
+                codes.append(course.code)
+                names.append(course.name)
+                instructors.append(inst_name.get(course.instructor_id, f"Instructor {course.instructor_id}"))
+                rooms.append(room.id if room else "N/A")
+                room_types.append(("Lab" if room.is_lab else "Classroom") if room else "N/A")
+                years.append(course.year)
+                types.append("Lab" if course.is_lab else "Theory")
+                conflicts.append("Yes" if slot.has_conflict else "No")
         
-        fieldnames = ["Day", "Time", "Course Code", "Course Name", "Instructor", "Room", "Room Type", "Year", "Type", "Conflict"]
-        DataManager.save_to_csv(rows, filepath, fieldnames)
+        columns = {
+            "Day": days,
+            "Time": times,
+            "Course Code": codes,
+            "Course Name": names,
+            "Instructor": instructors,
+            "Room": rooms,
+            "Room Type": room_types,
+            "Year": years,
+            "Type": types,
+            "Conflict": conflicts
+        }
+        DataManager.save_columns_to_csv(columns, filepath)
     
     @staticmethod
     def create_sample_data() -> Dict:
@@ -5,25 +5,70 @@ A Python-based GUI application for generating conflict-free course schedules
 """
 import sys
 import os
+from contextlib import contextmanager
 from typing import List, Optional
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QTableWidget, QTableWidgetItem, 
                              QPushButton, QLabel, QHeaderView, QMessageBox,
                              QFileDialog, QTextEdit, QDialog)
 from PyQt5.QtGui import QColor, QFont
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 
 # Backend modules
+from constants import DAYS, TIME_SLOTS
 from scheduler import Scheduler
 from data_manager import DataManager
 from report_generator import ReportGenerator
 
+# Startup sample data, resolved once at import time
+_SAMPLE_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_data.json")
+
 # ==========================================
 # BÖLÜM 2: GUI (KULLANICI ARAYÜZÜ)
 # PDF Referans: Implementation & Layout [Cite: 17, 19, 21, 22]
 # ==========================================
 
+class LoadJobSignals(QObject):
+    """Signals emitted by LoadJob (QRunnable itself is not a QObject)"""
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class LoadJob(QRunnable):
+    """Parses a JSON data file on a QThreadPool worker thread"""
+    
+    def __init__(self, filepath: str):
+        super().__init__()
+        self.filepath = filepath
+        self.signals = LoadJobSignals()
+    
+    def run(self):
+        try:
+            data = DataManager.load_from_json(self.filepath)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.loaded.emit(data)
+
+
 class BeePlanApp(QMainWindow):
+    # Tablo hücre renkleri ve fontu (her hücre için yeniden oluşturulmaz)
+    _CONFLICT_BG = QColor(255, 200, 200)  # Light red for conflicts
+    _CONFLICT_FG = QColor(139, 0, 0)  # Dark red text
+    _LAB_BG = QColor(240, 255, 240)  # Light green for labs
+    _LAB_FG = QColor(0, 100, 0)  # Dark green text
+    _THEORY_BG = QColor(240, 248, 255)  # Light blue for theory
+    _THEORY_FG = QColor(0, 0, 139)  # Dark blue text
+    _EXAM_BG = QColor(200, 200, 200)  # Gri renk
+    _CELL_FONT = QFont("Arial", 9)
+    # (is_lab, has_conflict) -> (background, foreground)
+    _CELL_COLORS = {
+        (False, False): (_THEORY_BG, _THEORY_FG),
+        (True, False): (_LAB_BG, _LAB_FG),
+        (False, True): (_CONFLICT_BG, _CONFLICT_FG),
+        (True, True): (_CONFLICT_BG, _CONFLICT_FG),
+    }
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("BeePlan - Course Scheduler")
@@ -33,8 +78,21 @@ class BeePlanApp(QMainWindow):
         self.scheduler: Optional[Scheduler] = None
         self.report_generator: Optional[ReportGenerator] = None
         self.courses = []
+        self.course_by_code = {}
         self.rooms = []
+        self.room_by_id = {}
         self.instructors = []
+        self.load_job: Optional[LoadJob] = None
+        
+        # Hücre prototipleri: her hücre bunlardan clone() ile kopyalanır
+        self._cell_prototypes = {
+            key: self._make_cell_prototype(background, foreground)
+            for key, (background, foreground) in self._CELL_COLORS.items()
+        }
+        self._exam_prototype = QTableWidgetItem("EXAM BLOCK")
+        self._exam_prototype.setBackground(self._EXAM_BG)
+        self._exam_prototype.setTextAlignment(Qt.AlignCenter)
+        self._exam_prototype.setFlags(Qt.ItemIsEnabled) # Düzenlemeyi engelle
         
         # Ana Layout
         self.central_widget = QWidget()
@@ -120,17 +178,11 @@ class BeePlanApp(QMainWindow):
 
     def setup_table(self):
         """Haftalık Ders Programı Tablosunu Oluşturur"""
-        days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-        time_slots = [
-            "08:30 - 09:20", "09:30 - 10:20", "10:30 - 11:20", "11:30 - 12:20",
-            "13:20 - 14:10", "14:20 - 15:10", "15:20 - 16:10", "16:20 - 17:10"
-        ]
-        
-        self.schedule_table.setRowCount(len(time_slots))
-        self.schedule_table.setColumnCount(len(days))
+        self.schedule_table.setRowCount(len(TIME_SLOTS))
+        self.schedule_table.setColumnCount(len(DAYS))
         
-        self.schedule_table.setHorizontalHeaderLabels(days)
-        self.schedule_table.setVerticalHeaderLabels(time_slots)
+        self.schedule_table.setHorizontalHeaderLabels(list(DAYS))
+        self.schedule_table.setVerticalHeaderLabels(list(TIME_SLOTS))
         
         # Tablo ayarları: Hücreleri ekrana yay
         header = self.schedule_table.horizontalHeader()
@@ -149,31 +201,29 @@ class BeePlanApp(QMainWindow):
 
     def mark_exam_block(self, row, col):
         """Cuma öğleden sonrasını 'Exam Block' olarak işaretler"""
-        item = QTableWidgetItem("EXAM BLOCK")
-        item.setBackground(QColor(200, 200, 200)) # Gri renk
-        item.setTextAlignment(Qt.AlignCenter)
-        item.setFlags(Qt.ItemIsEnabled) # Düzenlemeyi engelle
-        self.schedule_table.setItem(row, col, item)
+        self.schedule_table.setItem(row, col, self._exam_prototype.clone())
 
+    def init_backend(self, data):
+        """Parse loaded data and create the scheduler for it"""
+        self.courses, self.course_by_code = DataManager.parse_courses_indexed(data)
+        self.rooms, self.room_by_id = DataManager.parse_rooms_indexed(data)
+        self.instructors = DataManager.parse_instructors(data)
+        
+        # Initialize scheduler
+        self.scheduler = Scheduler(self.courses, self.rooms, self.instructors)
+        self.report_generator = ReportGenerator(self.scheduler)
+    
     def load_sample_data(self):
         """Load sample data for testing"""
         try:
-            data_manager = DataManager()
             # Try to load from sample_data.json first, fallback to create_sample_data
-            json_path = os.path.join(os.path.dirname(__file__), "sample_data.json")
-            if os.path.exists(json_path):
-                data = data_manager.load_from_json(json_path)
+            if os.path.exists(_SAMPLE_JSON):
+                data = DataManager.load_from_json(_SAMPLE_JSON)
             else:
                 # Fallback to generated sample data
-                data = data_manager.create_sample_data()
-            
-            self.courses = data_manager.parse_courses(data)
-            self.rooms = data_manager.parse_rooms(data)
-            self.instructors = data_manager.parse_instructors(data)
+                data = DataManager.create_sample_data()
             
-            # Initialize scheduler
-            self.scheduler = Scheduler(self.courses, self.rooms, self.instructors)
-            self.report_generator = ReportGenerator(self.scheduler)
+            self.init_backend(data)
             
             QMessageBox.information(self, "Data Loaded", 
                                   f"Loaded {len(self.courses)} course sessions, "
@@ -191,23 +241,30 @@ class BeePlanApp(QMainWindow):
         if not filepath:
             return
         
+        if not filepath.endswith('.json'):
+            # For CSV, you would need to implement CSV parsing
+            QMessageBox.warning(self, "Not Implemented", "CSV loading not fully implemented. Using JSON.")
+            return
+        
+        # Parse in the background so the window stays responsive on large files
+        self.load_job = LoadJob(filepath)
+        self.load_job.signals.loaded.connect(self._on_data_loaded)
+        self.load_job.signals.failed.connect(self._on_data_load_failed)
+        self.btn_load.setEnabled(False)
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        QThreadPool.globalInstance().start(self.load_job)
+    
+    def _finish_load_job(self):
+        """Restore the UI after a background load finished"""
+        QApplication.restoreOverrideCursor()
+        self.btn_load.setEnabled(True)
+        self.load_job = None
+    
+    def _on_data_loaded(self, data):
+        """Build backend objects from data parsed by LoadJob"""
+        self._finish_load_job()
         try:
-            data_manager = DataManager()
-            
-            if filepath.endswith('.json'):
-                data = data_manager.load_from_json(filepath)
-            else:
-                # For CSV, you would need to implement CSV parsing
-                QMessageBox.warning(self, "Not Implemented", "CSV loading not fully implemented. Using JSON.")
-                return
-            
-            self.courses = data_manager.parse_courses(data)
-            self.rooms = data_manager.parse_rooms(data)
-            self.instructors = data_manager.parse_instructors(data)
-            
-            # Initialize scheduler
-            self.scheduler = Scheduler(self.courses, self.rooms, self.instructors)
-            self.report_generator = ReportGenerator(self.scheduler)
+            self.init_backend(data)
             
             QMessageBox.information(self, "Data Loaded", 
                                   f"Loaded {len(self.courses)} courses, "
@@ -215,6 +272,11 @@ class BeePlanApp(QMainWindow):
                                   f"{len(self.instructors)} instructors")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load data: {str(e)}")
+    
+    def _on_data_load_failed(self, message):
+        """Report a parse error raised inside LoadJob"""
+        self._finish_load_job()
+        QMessageBox.critical(self, "Error", f"Failed to load data: {message}")
 
     def handle_generate(self):
         """Generate schedule using backend algorithm"""
@@ -285,18 +347,16 @@ class BeePlanApp(QMainWindow):
             return
         
         try:
-            data_manager = DataManager()
-            
             if selected_filter.startswith("JSON") or filepath.endswith('.json'):
                 if not filepath.endswith('.json'):
                     filepath += '.json'
-                data_manager.export_schedule_to_json(self.scheduler, filepath)
+                DataManager.export_schedule_to_json(self.scheduler, filepath)
                 QMessageBox.information(self, "Export Successful", 
                                       f"Schedule exported to:\n{filepath}")
             elif selected_filter.startswith("CSV") or filepath.endswith('.csv'):
                 if not filepath.endswith('.csv'):
                     filepath += '.csv'
-                data_manager.export_schedule_to_csv(self.scheduler, filepath)
+                DataManager.export_schedule_to_csv(self.scheduler, filepath)
                 QMessageBox.information(self, "Export Successful", 
                                       f"Schedule exported to:\n{filepath}")
             else:
@@ -321,59 +381,44 @@ class BeePlanApp(QMainWindow):
             return
         
         try:
-            data_manager = DataManager()
-            schedule_data = data_manager.load_from_json(filepath)
+            # Read-only access, so the lazy parser can skip building unused fields
+            schedule_data = DataManager.parse_json_lazy(filepath)
             
             # Validate schedule data structure
-            if 'schedule' not in schedule_data:
+            if 'slots' not in schedule_data and 'schedule' not in schedule_data:
                 raise ValueError("Invalid schedule file format")
             
             # Clear current schedule
-            for day in self.scheduler.days:
-                for time_slot in self.scheduler.time_slots:
-                    slot = self.scheduler.schedule[day][time_slot]
-                    if slot.course:
-                        slot.course = None
-                        slot.room = None
-                        slot.has_conflict = False
+            self.scheduler.clear_schedule()
             
             # Import schedule from JSON
+            course_by_code = self.course_by_code
+            room_by_id = self.room_by_id
+            days_set = set(self.scheduler.days)
+            slots_set = set(self.scheduler.time_slots)
+            
             imported_count = 0
-            for day in schedule_data.get('schedule', {}):
-                if day not in self.scheduler.days:
+            for day, time_slot, slot_data in DataManager.iter_schedule_slots(schedule_data):
+                if day not in days_set:
                     continue
-                for time_slot, slot_data in schedule_data['schedule'][day].items():
-                    if time_slot not in self.scheduler.time_slots:
-                        continue
-                    if slot_data is None:
-                        continue
-                    
-                    # Find course by code
-                    course_code = slot_data.get('course_code')
-                    course = None
-                    for c in self.courses:
-                        if c.code == course_code:
-                            course = c
-                            break
-                    
-                    if not course:
-                        continue
-                    
-                    # Find room by ID
-                    room_id = slot_data.get('room_id')
-                    room = None
-                    if room_id:
-                        for r in self.rooms:
-                            if r.id == room_id:
-                                room = r
-                                break
-                    
-                    # Place course in schedule
-                    slot = self.scheduler.schedule[day][time_slot]
-                    slot.course = course
-                    slot.room = room
-                    slot.has_conflict = slot_data.get('has_conflict', False)
-                    imported_count += 1
+                if time_slot not in slots_set:
+                    continue
+                
+                # Find course by code
+                course = course_by_code.get(slot_data.get('course_code'))
+                if not course:
+                    continue
+                
+                # Find room by ID
+                room_id = slot_data.get('room_id')
+                room = room_by_id.get(room_id) if room_id else None
+                
+                # Place course in schedule
+                slot = self.scheduler.get_slot(day, time_slot)
+                slot.course = course
+                slot.room = room
+                slot.has_conflict = slot_data.get('has_conflict', False)
+                imported_count += 1
             
             # Refresh display
             self.display_schedule()
@@ -383,15 +428,32 @@ class BeePlanApp(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Import Error", f"Failed to import schedule:\n{str(e)}")
     
+    @contextmanager
+    def batch_table_updates(self):
+        """Suspend repaints and signals while filling many table cells"""
+        table = self.schedule_table
+        sorting_enabled = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            yield
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting_enabled)
+            table.viewport().update()
+    
     def clear_schedule_table(self):
         """Clear all course entries from table (keep exam blocks)"""
-        for row in range(self.schedule_table.rowCount()):
-            for col in range(self.schedule_table.columnCount()):
-                item = self.schedule_table.item(row, col)
-                # Don't clear exam blocks (Friday 13:20-15:10)
-                if item and item.text() == "EXAM BLOCK":
-                    continue
-                self.schedule_table.setItem(row, col, None)
+        with self.batch_table_updates():
+            for row in range(self.schedule_table.rowCount()):
+                for col in range(self.schedule_table.columnCount()):
+                    item = self.schedule_table.item(row, col)
+                    # Don't clear exam blocks (Friday 13:20-15:10)
+                    if item and item.text() == "EXAM BLOCK":
+                        continue
+                    self.schedule_table.setItem(row, col, None)
     
     def display_schedule(self):
         """Display schedule from scheduler in the table"""
@@ -399,59 +461,54 @@ class BeePlanApp(QMainWindow):
             return
         
         schedule_grid = self.scheduler.get_schedule_grid()
-        days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-        
-        for row_idx, row in enumerate(schedule_grid):
-            for col_idx, cell in enumerate(row):
-                if cell:
-                    course = cell['course']
-                    room = cell['room']
-                    instructor = cell.get('instructor', 'N/A')
-                    has_conflict = cell['has_conflict']
-                    
-                    # Format text with better layout
-                    # Course code and name
-                    text = f"📚 {course.code}\n{course.name}"
-                    
-                    # Room information
-                    if room:
-                        room_type = "🔬 LAB" if room.is_lab else "🏫 Room"
-                        text += f"\n\n{room_type}: {room.id}"
-                    
-                    # Instructor information
-                    text += f"\n👤 {instructor}"
-                    
-                    # Lab indicator
-                    if course.is_lab:
-                        text += "\n[LAB SESSION]"
-                    
-                    self.add_course_to_grid(row_idx, col_idx, text, has_conflict)
+        
+        with self.batch_table_updates():
+            for row_idx, row in enumerate(schedule_grid):
+                for col_idx, cell in enumerate(row):
+                    if cell:
+                        course = cell['course']
+                        room = cell['room']
+                        instructor = cell.get('instructor', 'N/A')
+                        has_conflict = cell['has_conflict']
+                        
+                        # Format text with better layout
+                        # Course code and name
+                        text = f"📚 {course.code}\n{course.name}"
+                        
+                        # Room information
+                        if room:
+                            room_type = "🔬 LAB" if room.is_lab else "🏫 Room"
+                            text += f"\n\n{room_type}: {room.id}"
+                        
+                        # Instructor information
+                        text += f"\n👤 {instructor}"
+                        
+                        # Lab indicator
+                        if course.is_lab:
+                            text += "\n[LAB SESSION]"
+                        
+                        self.add_course_to_grid(row_idx, col_idx, text, has_conflict, course.is_lab)
 
-    def add_course_to_grid(self, row, col, text, has_conflict=False):
-        """Tabloya ders ekler ve gerekirse renklendirir [Cite: 20]"""
-        item = QTableWidgetItem(text)
+    def _make_cell_prototype(self, background, foreground):
+        """Course cell with the given colors, cloned by add_course_to_grid"""
+        item = QTableWidgetItem()
         item.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
         
         # Set font for better readability
-        font = QFont("Arial", 9)
-        item.setFont(font)
+        item.setFont(self._CELL_FONT)
         
-        # Color coding
-        if has_conflict:
-            item.setBackground(QColor(255, 200, 200))  # Light red for conflicts
-            item.setForeground(QColor(139, 0, 0))  # Dark red text
-        else:
-            # Different colors for labs vs theory
-            if "[LAB SESSION]" in text:
-                item.setBackground(QColor(240, 255, 240))  # Light green for labs
-                item.setForeground(QColor(0, 100, 0))  # Dark green text
-            else:
-                item.setBackground(QColor(240, 248, 255))  # Light blue for theory
-                item.setForeground(QColor(0, 0, 139))  # Dark blue text
+        item.setBackground(background)
+        item.setForeground(foreground)
         
         # Make item selectable but not editable
         item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-        
+        return item
+    
+    def add_course_to_grid(self, row, col, text, has_conflict=False, is_lab=False):
+        """Tabloya ders ekler ve gerekirse renklendirir [Cite: 20]"""
+        # Color coding: conflicts first, then different colors for labs vs theory
+        item = self._cell_prototypes[bool(is_lab), bool(has_conflict)].clone()
+        item.setText(text)
         self.schedule_table.setItem(row, col, item)
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 Data Models Module
 Contains all data structures for the scheduling system
 """
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional
 
@@ -10,19 +11,19 @@ from typing import List, Optional
 # PDF Referans: Core Requirements [Cite: 5-10]
 # ==========================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Instructor:
     id: int
     name: str
     availability: List[str] = field(default_factory=list) # Örn: ["Monday", "Tuesday"]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Room:
     id: str
     capacity: int
     is_lab: bool  # Lab kapasitesi ve türü [Cite: 10, 29]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Course:
     code: str
     name: str
@@ -31,8 +32,13 @@ class Course:
     is_lab: bool
     requires_projector: bool = False
     year: int = 1 # 1st-4th year [Cite: 12]
+    # Bölüm etiketi (örn. "CENG"), kod önekinden bir kez hesaplanır (elective kuralları için)
+    _dept: str = field(init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self):
+        object.__setattr__(self, '_dept', sys.intern(self.code[:4].upper()))
+
+@dataclass(slots=True)
 class ScheduleSlot:
     day: str
     time_slot: str
@@ -2,7 +2,9 @@
 Report Generation Module
 Creates validation reports with conflict details
 """
+from collections import Counter, defaultdict
 from typing import List, Dict
+from constants import DAYS, TIME_SLOTS
 from scheduler import Scheduler
 
 
@@ -24,7 +26,7 @@ class ReportGenerator:
         report_lines.append("")
         
         # Summary
-        total_courses = sum(1 for row in schedule_grid for cell in row if cell is not None)
+        total_courses = self.scheduler.get_placed_count()
         report_lines.append(f"Total Courses Scheduled: {total_courses}")
         report_lines.append(f"Total Conflicts Detected: {len(conflicts)}")
         report_lines.append("")
@@ -37,12 +39,9 @@ class ReportGenerator:
             report_lines.append("-" * 60)
             
             # Group conflicts by type
-            conflict_types = {}
+            conflict_types: Dict[str, List[Dict]] = defaultdict(list)
             for conflict in conflicts:
-                conflict_type = conflict.get('type', 'unknown')
-                if conflict_type not in conflict_types:
-                    conflict_types[conflict_type] = []
-                conflict_types[conflict_type].append(conflict)
+                conflict_types[conflict.get('type', 'unknown')].append(conflict)
             
             # Report each type
             for conflict_type, conflict_list in conflict_types.items():
@@ -60,21 +59,12 @@ class ReportGenerator:
         report_lines.append("=" * 60)
         report_lines.append("")
         
-        # Detailed schedule
-        days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-        time_slots = [
-            "08:30 - 09:20", "09:30 - 10:20", "10:30 - 11:20", "11:30 - 12:20",
-            "13:20 - 14:10", "14:20 - 15:10", "15:20 - 16:10", "16:20 - 17:10"
-        ]
-        
-        for day in days:
+        # Detailed schedule, grid transposed once so each day is a column of cells
+        day_columns = zip(*schedule_grid)
+        for day, column in zip(DAYS, day_columns):
             report_lines.append(f"\n{day}:")
             report_lines.append("-" * 40)
-            for i, time_slot in enumerate(time_slots):
-                row = schedule_grid[i]
-                day_index = days.index(day)
-                cell = row[day_index]
-                
+            for time_slot, cell in zip(TIME_SLOTS, column):
                 if cell:
                     course = cell['course']
                     room = cell['room']
@@ -93,17 +83,12 @@ class ReportGenerator:
         if len(conflicts) == 0:
             return "✓ No conflicts detected. Schedule is valid!"
         
-        summary = f"⚠ {len(conflicts)} conflict(s) detected:\n\n"
+        summary_parts = [f"⚠ {len(conflicts)} conflict(s) detected:\n\n"]
         
-        conflict_types = {}
-        for conflict in conflicts:
-            conflict_type = conflict.get('type', 'unknown')
-            if conflict_type not in conflict_types:
-                conflict_types[conflict_type] = 0
-            conflict_types[conflict_type] += 1
+        conflict_types = Counter(conflict.get('type', 'unknown') for conflict in conflicts)
         
         for conflict_type, count in conflict_types.items():
-            summary += f"• {conflict_type.replace('_', ' ').title()}: {count}\n"
+            summary_parts.append(f"• {conflict_type.replace('_', ' ').title()}: {count}\n")
         
-        return summary
+        return "".join(summary_parts)
 
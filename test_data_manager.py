@@ -0,0 +1,46 @@
+"""
+Data manager tests
+load_from_csv reads through pyarrow when it is installed, so it must return
+the same rows as csv.DictReader on the file opened in text mode.
+Run with: python -m unittest test_data_manager
+"""
+import csv
+import os
+import tempfile
+import unittest
+
+from data_manager import DataManager
+
+
+class LoadFromCsvTest(unittest.TestCase):
+    """load_from_csv must read like csv.DictReader"""
+
+    def assert_reads_like_dict_reader(self, content):
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "data.csv")
+            with open(filepath, 'wb') as f:
+                f.write(content)
+            with open(filepath, 'r', encoding='utf-8') as f:
+                expected = list(csv.DictReader(f))
+            self.assertEqual(DataManager.load_from_csv(filepath), expected)
+
+    def test_plain_file(self):
+        self.assert_reads_like_dict_reader(b'code,year\r\nSENG101,1\r\nCENG201,2.5\r\n,true\r\n')
+
+    def test_utf8_bom(self):
+        """Excel saves UTF-8 CSV with a BOM, the first column must still be text"""
+        self.assert_reads_like_dict_reader(b'\xef\xbb\xbfyear,code\r\n1,SENG101\r\n')
+
+    def test_ragged_rows(self):
+        self.assert_reads_like_dict_reader(b'code,year\nSENG101,1\nCENG201\n')
+        self.assert_reads_like_dict_reader(b'code,year\nSENG101,1,extra\n')
+
+    def test_line_ends_in_quoted_values(self):
+        self.assert_reads_like_dict_reader(b'name,year\r\n"Line\r\nbreak",1\r\n"Carriage\rreturn",2\r\n')
+
+    def test_empty_file(self):
+        self.assert_reads_like_dict_reader(b'')
+
+
+if __name__ == "__main__":
+    unittest.main()
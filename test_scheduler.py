@@ -0,0 +1,164 @@
+"""
+Scheduler tests
+The compiled placement kernel repeats the placement rules of
+Scheduler._place_courses, so both paths must give the same schedule.
+Run with: python -m unittest test_scheduler
+"""
+import os
+import random
+import unittest
+from unittest import mock
+
+from constants import DAYS
+from data_manager import DataManager
+from models import Course, Instructor, Room
+from scheduler import Scheduler
+
+SAMPLE_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_data.json")
+
+
+def lab_data():
+    """
+    61 course sessions, mostly labs: 8 theory courses with 5 lab sessions
+    each, labs without a theory course and an oversized lab room
+    """
+    instructors = [
+        {"id": i, "name": f"Instructor {i}", "availability": list(DAYS[i % 3:] if i % 2 else DAYS)}
+        for i in range(1, 6)
+    ]
+    courses = []
+    for i in range(8):
+        code = f"{'CENG' if i % 2 else 'SENG'}{i + 1:03d}"
+        instructor_id = i % 5 + 1
+        year = i % 4 + 1
+        courses.append({"code": code, "name": code, "instructor_id": instructor_id,
+                        "is_lab": False, "year": year})
+        for _ in range(5):
+            courses.append({"code": code + "L", "name": code + " Lab", "instructor_id": instructor_id,
+                            "is_lab": True, "year": year})
+    for i in range(13):
+        code = f"SENG{500 + i}L"  # no theory course
+        courses.append({"code": code, "name": code, "instructor_id": i % 5 + 1,
+                        "is_lab": True, "year": i % 4 + 1})
+    rooms = [
+        {"id": "A101", "capacity": 60, "is_lab": False},
+        {"id": "A102", "capacity": 40, "is_lab": False},
+        {"id": "LAB1", "capacity": 30, "is_lab": True},
+        {"id": "LAB2", "capacity": 40, "is_lab": True},
+        {"id": "LAB3", "capacity": 60, "is_lab": True},
+    ]
+    return {"courses": courses, "rooms": rooms, "instructors": instructors}
+
+
+def scheduler_for(data):
+    return Scheduler(DataManager.parse_courses(data), DataManager.parse_rooms(data),
+                     DataManager.parse_instructors(data))
+
+
+class JitPlacementTest(unittest.TestCase):
+    """_place_courses_jit must place exactly like _place_courses"""
+
+    def setUp(self):
+        if not Scheduler._try_jit():
+            self.skipTest("numba is not installed")
+
+    def generate(self, scheduler, use_jit, runs=1):
+        """State after each generate_schedule run, on the JIT or the Python path"""
+        threshold = 0 if use_jit else 10 ** 9
+        results = []
+        # Never take the random break gap, the two paths draw random numbers differently
+        with mock.patch.object(Scheduler, "JIT_MIN_COURSES", threshold), \
+                mock.patch("scheduler.random.random", return_value=0.5):
+            for _ in range(runs):
+                ok = scheduler.generate_schedule()
+                results.append((
+                    ok,
+                    [(slot.course.code if slot.course else None, slot.room.id if slot.room else None)
+                     for slot in scheduler.slots],
+                    scheduler.get_conflicts(),
+                    scheduler.instructor_day_hours,
+                    scheduler.room_busy,
+                    scheduler.instructor_busy,
+                    scheduler.course_bits,
+                ))
+        return results
+
+    def assert_same_placement(self, data, preplaced_bits=()):
+        results = []
+        for use_jit in (False, True):
+            scheduler = scheduler_for(data)
+            # Existing placements (like an imported schedule) leave irregular gaps
+            for course, bit in zip(scheduler.courses, preplaced_bits):
+                scheduler.slots[bit].course = course
+            # Second run starts from the placements of the first one
+            results.append(self.generate(scheduler, use_jit, runs=2))
+        self.assertTrue(any(code for code, _ in results[0][0][1]))
+        self.assertEqual(results[0], results[1])
+
+    def test_sample_data(self):
+        self.assert_same_placement(DataManager.load_from_json(SAMPLE_JSON))
+
+    def test_lab_data(self):
+        data = lab_data()
+        self.assertEqual(len(data["courses"]), 61)
+        self.assert_same_placement(data)
+
+    def test_preplaced_courses(self):
+        for preplaced_bits in ([bit for bit in range(40) if bit * 7 % 5 == 0],
+                               [bit for bit in range(40) if bit * 3 % 11 in (0, 4)]):
+            self.assert_same_placement(DataManager.load_from_json(SAMPLE_JSON), preplaced_bits)
+            self.assert_same_placement(lab_data(), preplaced_bits)
+
+    def test_break_rules_on_random_grids(self):
+        """One course allowed in a single cell, next to randomly occupied cells"""
+        rng = random.Random(383)
+        rooms = [Room(id="A101", capacity=60, is_lab=False)]
+        instructors = [Instructor(id=1, name="Target", availability=list(DAYS)),
+                       Instructor(id=2, name="Filler", availability=list(DAYS))]
+        filler = Course(code="FILL100", name="Filler", instructor_id=2, duration_hours=1, is_lab=False)
+        for _ in range(40):
+            occupied = {bit for bit in range(40) if rng.random() < 0.4}
+            for bit in set(range(40)) - occupied:
+                results = []
+                for use_jit in (False, True):
+                    course = Course(code="SENG101", name="Target", instructor_id=1,
+                                    duration_hours=1, is_lab=False)
+                    scheduler = Scheduler([course], rooms, instructors)
+                    for filled in occupied:
+                        scheduler.slots[filled].course = filler
+                    scheduler.avail_mask[1] = 1 << bit
+                    results.append(self.generate(scheduler, use_jit))
+                self.assertEqual(results[0], results[1], f"cell {bit}, occupied {sorted(occupied)}")
+
+    def test_daily_theory_limit(self):
+        """Six theory courses of an instructor who only teaches on Monday"""
+        data = {
+            "courses": [{"code": f"CENG{300 + i}", "name": "Theory", "instructor_id": 1, "year": 3}
+                        for i in range(6)],
+            "rooms": [{"id": "A101", "capacity": 60}],
+            "instructors": [{"id": 1, "name": "Monday only", "availability": ["Monday"]}],
+        }
+        self.assert_same_placement(data)
+
+
+class ConflictTest(unittest.TestCase):
+    """Conflicts reported by generate_schedule"""
+
+    def test_unplaced_course_is_reported(self):
+        """A course of an instructor with no teaching day cannot be placed"""
+        data = {
+            "courses": [{"code": "SENG101", "name": "Placed", "instructor_id": 1},
+                        {"code": "SENG102", "name": "Unplaced", "instructor_id": 2}],
+            "rooms": [{"id": "A101", "capacity": 60}],
+            "instructors": [{"id": 1, "name": "Any day", "availability": list(DAYS)},
+                            {"id": 2, "name": "No day", "availability": []}],
+        }
+        scheduler = scheduler_for(data)
+        self.assertFalse(scheduler.generate_schedule())
+        self.assertEqual([(conflict["type"], conflict["course"]) for conflict in scheduler.get_conflicts()],
+                         [("unplaced_course", "SENG102")])
+        self.assertEqual([slot.course.code for slot in scheduler.slots if slot.course], ["SENG101"])
+
+
+if __name__ == "__main__":
+    unittest.main()